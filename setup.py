@@ -1,9 +1,22 @@
 """Setup configuration for fiscflow-receipt-ocr package."""
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
 
+# Optionally compile the receipt parser with mypyc (FISCFLOW_USE_MYPYC=1).
+# The pure-Python module stays importable when the extension is not built.
+ext_modules = []
+if os.environ.get("FISCFLOW_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify([
+        "--ignore-missing-imports",
+        "src/fiscflow_ocr/extractors/vision_api.py",
+    ])
+
 setup(
     name="fiscflow-receipt-ocr",
     version="0.1.0",
@@ -32,10 +45,11 @@ setup(
     ],
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    ext_modules=ext_modules,
     python_requires=">=3.8",
     install_requires=[
         "google-cloud-vision>=3.0.0",
-        "Pillow>=9.0.0",
+        "Pillow>=9.1.0",
         "numpy>=1.20.0",
         "python-dateutil>=2.8.0",
     ],
@@ -45,9 +59,15 @@ setup(
             "pytest-cov>=3.0.0",
             "black>=22.0.0",
             "flake8>=4.0.0",
-            "mypy>=0.950",
+            "mypy[mypyc]>=0.950",
             "isort>=5.10.0",
         ],
+        "fast": [
+            "numba>=0.56.0",
+        ],
+        "gcs": [
+            "google-cloud-storage>=2.0.0",  # PDF/TIFF input
+        ],
         "ml": [
             "spacy>=3.0.0",
             "transformers>=4.20.0",
@@ -1,10 +1,13 @@
 """Main ReceiptOCR client."""
-from typing import Dict, List, Optional, Union
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union, cast
 from pathlib import Path
 
 from .extractors.base import BaseExtractor
 from .extractors.vision_api import GoogleVisionExtractor
 from .models.receipt import Receipt
+from .utils.cache import ResultCache
 
 
 class ReceiptOCR:
@@ -18,6 +21,9 @@ class ReceiptOCR:
         'COSTCO WHOLESALE'
     """
 
+    # Upper bound on concurrent file reads in extract_batch()
+    MAX_READ_WORKERS = 32
+
     PROVIDERS = {
         'google_vision': GoogleVisionExtractor,
         # 'aws_textract': AWSTextractExtractor,  # TODO
@@ -33,6 +39,7 @@ class ReceiptOCR:
         model_path: Optional[str] = None,
         min_confidence: float = 0.5,
         feedback_enabled: bool = False,
+        cache_dir: Optional[Union[str, Path]] = None,
         **kwargs
     ):
         """
@@ -44,6 +51,8 @@ class ReceiptOCR:
             model_path: Path to ML model (if using ML provider)
             min_confidence: Minimum confidence threshold for extraction
             feedback_enabled: Enable user feedback collection
+            cache_dir: Directory for caching results by image content
+                (disabled if None)
             **kwargs: Additional provider-specific arguments
         """
         if provider not in self.PROVIDERS:
@@ -60,8 +69,12 @@ class ReceiptOCR:
             **kwargs
         )
 
+        self._cache: Optional[ResultCache] = (
+            ResultCache(Path(cache_dir) / provider) if cache_dir else None
+        )
+
         self.feedback_enabled = feedback_enabled
-        self.feedback_storage = []  # TODO: Implement proper storage
+        self.feedback_storage: List[Dict] = []  # TODO: Implement proper storage
 
     def extract(self, image: Union[bytes, Path, str]) -> Dict:
         """
@@ -86,18 +99,22 @@ class ReceiptOCR:
                 'raw_text': str
             }
         """
-        # Convert to bytes if needed
-        if isinstance(image, (str, Path)):
-            with open(image, 'rb') as f:
-                image_bytes = f.read()
-        else:
-            image_bytes = image
+        image_bytes = self._read_image(image)
+
+        if self._cache is not None:
+            key = self._cache.key(image_bytes)
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
 
         # Extract using selected provider
         receipt = self.extractor.extract(image_bytes)
 
         # Convert to dict
-        return receipt.to_dict()
+        result = receipt.to_dict()
+        if self._cache is not None:
+            self._cache.set(key, result)
+        return result
 
     def extract_batch(self, images: List[Union[bytes, Path, str]]) -> List[Dict]:
         """
@@ -109,7 +126,74 @@ class ReceiptOCR:
         Returns:
             List of extraction results
         """
-        return [self.extract(img) for img in images]
+        image_bytes, keys, results = self._prepare_batch(images)
+        misses = [i for i, result in enumerate(results) if result is None]
+
+        receipts = self.extractor.extract_batch([image_bytes[i] for i in misses])
+        return self._complete_batch(keys, results, misses, receipts)
+
+    async def extract_batch_async(self, images: List[Union[bytes, Path, str]]) -> List[Dict]:
+        """
+        Async variant of extract_batch() for use inside a running event loop.
+
+        Args:
+            images: List of images
+
+        Returns:
+            List of extraction results
+        """
+        loop = asyncio.get_running_loop()
+        image_bytes, keys, results = await loop.run_in_executor(None, self._prepare_batch, images)
+        misses = [i for i, result in enumerate(results) if result is None]
+
+        receipts = await self.extractor.extract_batch_async([image_bytes[i] for i in misses])
+        return self._complete_batch(keys, results, misses, receipts)
+
+    def _prepare_batch(
+        self,
+        images: List[Union[bytes, Path, str]]
+    ) -> Tuple[List[bytes], List[str], List[Optional[Dict]]]:
+        """Read a batch and look up cached results (None marks a miss)."""
+        image_bytes = self._read_images(images)
+
+        if self._cache is None:
+            return image_bytes, [], [None] * len(image_bytes)
+
+        keys = [self._cache.key(b) for b in image_bytes]
+        return image_bytes, keys, [self._cache.get(key) for key in keys]
+
+    def _complete_batch(
+        self,
+        keys: List[str],
+        results: List[Optional[Dict]],
+        misses: List[int],
+        receipts: List[Receipt]
+    ) -> List[Dict]:
+        """Fill cache misses with fresh extractions, caching them if enabled."""
+        for i, receipt in zip(misses, receipts):
+            result = receipt.to_dict()
+            if self._cache is not None:
+                self._cache.set(keys[i], result)
+            results[i] = result
+
+        return cast(List[Dict], results)
+
+    def _read_images(self, images: List[Union[bytes, Path, str]]) -> List[bytes]:
+        """Read all file paths concurrently so disk latency overlaps."""
+        num_paths = sum(isinstance(img, (str, Path)) for img in images)
+        if num_paths <= 1:
+            return [self._read_image(img) for img in images]
+
+        with ThreadPoolExecutor(max_workers=min(self.MAX_READ_WORKERS, num_paths)) as pool:
+            return list(pool.map(self._read_image, images))
+
+    @staticmethod
+    def _read_image(image: Union[bytes, Path, str]) -> bytes:
+        """Convert a file path to bytes; bytes are returned unchanged."""
+        if isinstance(image, (str, Path)):
+            with open(image, 'rb') as f:
+                return f.read()
+        return image
 
     def submit_feedback(
         self,
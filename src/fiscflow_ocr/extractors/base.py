@@ -1,6 +1,10 @@
 """Base extractor interface."""
+import asyncio
+import io
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
+
+from PIL import Image, ImageOps
 
 from ..models.receipt import Receipt
 
@@ -12,6 +16,12 @@ class BaseExtractor(ABC):
     All extractors must implement the extract() method.
     """
 
+    # OCR accuracy saturates well below phone-camera resolution, so larger
+    # images are downscaled and re-encoded before upload
+    MAX_IMAGE_DIMENSION = 2048
+    JPEG_QUALITY = 85
+    PREPROCESS_MIN_BYTES = 500_000
+
     def __init__(
         self,
         credentials_path: Optional[str] = None,
@@ -49,18 +59,78 @@ class BaseExtractor(ABC):
         """
         pass
 
+    def extract_batch(self, images: List[bytes]) -> List[Receipt]:
+        """
+        Extract receipt data from multiple images.
+
+        Extractors whose backend supports batching or concurrent
+        requests should override this; the default runs extract()
+        on each image in turn.
+
+        Args:
+            images: List of raw image bytes
+
+        Returns:
+            List of Receipt objects, in the same order as images
+        """
+        return [self.extract(image_bytes) for image_bytes in images]
+
+    async def extract_batch_async(self, images: List[bytes]) -> List[Receipt]:
+        """
+        Async variant of extract_batch() for use inside a running event loop.
+
+        The default runs extract_batch() on the loop's default executor.
+
+        Args:
+            images: List of raw image bytes
+
+        Returns:
+            List of Receipt objects, in the same order as images
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.extract_batch, images)
+
     def preprocess_image(self, image_bytes: bytes) -> bytes:
         """
         Preprocess image before OCR (optional).
 
+        Images larger than PREPROCESS_MIN_BYTES are downscaled to fit
+        within MAX_IMAGE_DIMENSION and re-encoded as JPEG. Small images,
+        formats Pillow cannot decode, and re-encodes that come out larger
+        are returned unchanged.
+
         Args:
             image_bytes: Raw image bytes
 
         Returns:
             Preprocessed image bytes
         """
-        # TODO: Add preprocessing (resize, denoise, etc.)
-        return image_bytes
+        if len(image_bytes) < self.PREPROCESS_MIN_BYTES:
+            return image_bytes
+
+        try:
+            # Apply EXIF rotation before the metadata is dropped on re-encode
+            img = ImageOps.exif_transpose(Image.open(io.BytesIO(image_bytes)))
+            img.thumbnail(
+                (self.MAX_IMAGE_DIMENSION, self.MAX_IMAGE_DIMENSION),
+                Image.Resampling.LANCZOS,
+            )
+
+            # JPEG has no alpha; flatten onto white so transparent areas
+            # do not turn black
+            if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+                img = img.convert('RGBA')
+                background = Image.new('RGB', img.size, 'white')
+                background.paste(img, mask=img.getchannel('A'))
+                img = background
+
+            buf = io.BytesIO()
+            img.convert('RGB').save(buf, format='JPEG', quality=self.JPEG_QUALITY, optimize=True)
+        except (OSError, ValueError, Image.DecompressionBombError):
+            return image_bytes
+
+        processed = buf.getvalue()
+        return processed if len(processed) < len(image_bytes) else image_bytes
 
     def validate_result(self, receipt: Receipt) -> bool:
         """
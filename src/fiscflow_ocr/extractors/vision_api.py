@@ -1,13 +1,77 @@
 """Google Vision API extractor."""
+import asyncio
 import re
 import os
-from typing import Dict, List, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from itertools import islice
+from typing import Awaitable, Dict, List, Optional, Set, Tuple, cast
 from datetime import datetime
+
+import numpy as np
+from dateutil import parser as date_parser
 from google.cloud import vision
 from google.cloud.vision_v1 import types
+from google.cloud.vision_v1.services.image_annotator.transports import (
+    ImageAnnotatorGrpcAsyncIOTransport,
+    ImageAnnotatorGrpcTransport,
+)
 
 from .base import BaseExtractor
 from ..models.receipt import Receipt, ReceiptItem
+from ..utils.geometry import cluster_lines
+
+
+# Keywords marking lines that are not purchasable items. They are matched
+# as one compiled alternation (_SKIP_RE); on receipt-length lines this is
+# as fast as an Aho-Corasick automaton, without the extra dependency.
+_SKIP_KEYWORDS = (
+    'subtotal', 'total', 'tax', 'change', 'cash', 'credit', 'debit',
+    'visa', 'mastercard', 'thank you', 'receipt', 'date', 'time',
+    'approved', 'customer', 'member', 'number', 'reference', 'invoice',
+)
+
+# Patterns are compiled once at import rather than looked up per line.
+# _MONEY_RE and _SKIP_RE expect text lowercased up front: one lower() call
+# over the whole text is much cheaper than IGNORECASE matching per line.
+_MERCHANT_IGNORE_RE = re.compile(r'receipt|invoice|bill|^\d+$|^tel:|^www\.', re.IGNORECASE)
+_MERCHANT_CLEAN_RE = re.compile(r'[^a-zA-Z0-9\s\-&\.]')
+# Month-first then year-first dates. Groups are (month, sep, day, sep,
+# year) and (year, sep, month, sep, day); only the first match of each is
+# tried, and _extract_date() validates it before parsing
+_DATE_RES = (
+    (re.compile(r'(\d{1,2})([-/])(\d{1,2})([-/])(\d{2,4})'), 1, 5),
+    (re.compile(r'(\d{4})([-/])(\d{1,2})([-/])(\d{1,2})'), 3, 1),
+)
+_MONEY_RE = re.compile(r'(total|amount|tax|vat)[:\s]+\$?\s*(\d+\.\d{2})')
+# When one line has several amounts, 'total' beats 'amount' and 'tax'
+# beats 'vat' (lower wins), regardless of position in the line
+_MONEY_PRIORITY = {'total': 0, 'amount': 1, 'tax': 0, 'vat': 1}
+_PRICE_RE = re.compile(r'^\$?(\d+\.\d{2})$')
+_QTY_RE = re.compile(r'^(\d+\.?\d*)\s*x?\s*(.+)$', re.IGNORECASE)
+_SKIP_RE = re.compile('|'.join(re.escape(k) for k in _SKIP_KEYWORDS))
+
+_VISION_HOST = 'vision.googleapis.com:443'
+
+# Keep the HTTP/2 connection warm between requests so repeated extractions
+# reuse one TLS session; message limits match the Vision client defaults
+_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.max_send_message_length', -1),
+    ('grpc.max_receive_message_length', -1),
+]
+
+# Leading magic bytes of multi-page formats that Vision only accepts
+# through the file annotation API
+_DOCUMENT_SIGNATURES = (
+    (b'%PDF', 'application/pdf'),
+    (b'II*\x00', 'image/tiff'),
+    (b'MM\x00*', 'image/tiff'),
+)
+
+# Maximum vertical distance (pixels) between words on the same line
+_LINE_THRESHOLD = 15.0
 
 
 class GoogleVisionExtractor(BaseExtractor):
@@ -18,17 +82,48 @@ class GoogleVisionExtractor(BaseExtractor):
     for high-accuracy receipt data extraction.
     """
 
-    def __init__(self, **kwargs):
-        """Initialize Google Vision API client."""
+    # Maximum number of images accepted by a single batch_annotate_images call
+    BATCH_SIZE = 16
+
+    # Chunks in flight at once; bounds concurrent RPCs and the number of
+    # preprocessed images held in memory
+    MAX_CONCURRENT_CHUNKS = 4
+
+    # PDF/TIFF jobs: pages per output JSON file, seconds to wait for the
+    # operation, and parallel downloads of output files
+    DOCUMENT_PAGES_PER_OUTPUT = 20
+    DOCUMENT_TIMEOUT = 600
+    MAX_DOWNLOAD_WORKERS = 8
+
+    # PDF page sizes are reported in points (1/72 inch); they are scaled to
+    # this resolution so the pixel line threshold applies as for photos
+    PDF_PIXELS_PER_INCH = 200
+
+    def __init__(self, **kwargs) -> None:
+        """
+        Initialize Google Vision API client.
+
+        Args:
+            scratch_bucket: GCS bucket for staging PDF/TIFF input and
+                results (required only for those formats)
+            **kwargs: Arguments passed to BaseExtractor
+        """
         super().__init__(**kwargs)
 
+        self.scratch_bucket: Optional[str] = self.config.get('scratch_bucket')
+
         # Set credentials if provided
         if self.credentials_path:
             os.environ['GOOGLE_APPLICATION_CREDENTIALS'] = self.credentials_path
 
-        # Initialize Vision API client
+        # Initialize Vision API client over a long-lived, tuned channel
         try:
-            self.client = vision.ImageAnnotatorClient()
+            channel = ImageAnnotatorGrpcTransport.create_channel(
+                _VISION_HOST, options=_CHANNEL_OPTIONS
+            )
+            self.client = vision.ImageAnnotatorClient(
+                transport=ImageAnnotatorGrpcTransport(channel=channel)
+            )
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Google Vision API: {e}")
 
@@ -42,12 +137,260 @@ class GoogleVisionExtractor(BaseExtractor):
         Returns:
             Receipt object with extracted data
         """
+        mime_type = self._document_mime_type(image_bytes)
+        if mime_type:
+            return self._extract_document(image_bytes, mime_type)
+
         # Create Vision API image object
-        image = types.Image(content=image_bytes)
+        image = types.Image(content=self.preprocess_image(image_bytes))
 
         # Perform OCR
         response = self.client.document_text_detection(image=image)
 
+        return self._parse_response(response)
+
+    def extract_batch(self, images: List[bytes]) -> List[Receipt]:
+        """
+        Extract receipt data from multiple images.
+
+        Images are sent in chunks of BATCH_SIZE per batch_annotate_images
+        call, with up to MAX_CONCURRENT_CHUNKS chunks in flight. PDF/TIFF
+        documents run as file annotation jobs alongside them.
+
+        Safe to call from inside a running event loop (e.g. Jupyter), but
+        async callers should prefer awaiting extract_batch_async().
+
+        Args:
+            images: List of raw image bytes
+
+        Returns:
+            List of Receipt objects, in the same order as images
+        """
+        try:
+            asyncio.get_running_loop()
+            in_running_loop = True
+        except RuntimeError:
+            in_running_loop = False
+
+        # Run outside the except clause: under mypyc the pending exception
+        # leaks into the coroutine and breaks its get_running_loop() calls
+        if not in_running_loop:
+            return asyncio.run(self.extract_batch_async(images))
+
+        # asyncio.run() cannot nest inside a running loop, so give the
+        # batch its own loop on a worker thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self.extract_batch_async(images)).result()
+
+    async def extract_batch_async(self, images: List[bytes]) -> List[Receipt]:
+        """
+        Async variant of extract_batch() for use inside a running event loop.
+
+        Args:
+            images: List of raw image bytes
+
+        Returns:
+            List of Receipt objects, in the same order as images
+        """
+        if not images:
+            return []
+
+        image_indices = []
+        document_indices = []
+        for i, image_bytes in enumerate(images):
+            if self._document_mime_type(image_bytes):
+                document_indices.append(i)
+            else:
+                image_indices.append(i)
+
+        # Documents cannot go through batch_annotate_images; their blocking
+        # file jobs run on the default executor alongside the image chunks
+        loop = asyncio.get_running_loop()
+        jobs: List[Awaitable[List[Receipt]]] = [
+            self._extract_images_async([images[i] for i in image_indices]),
+            asyncio.gather(*(
+                loop.run_in_executor(None, self.extract, images[i]) for i in document_indices
+            )),
+        ]
+        image_receipts, document_receipts = await asyncio.gather(*jobs)
+
+        receipts: List[Optional[Receipt]] = [None] * len(images)
+        for i, receipt in zip(image_indices, image_receipts):
+            receipts[i] = receipt
+        for i, receipt in zip(document_indices, document_receipts):
+            receipts[i] = receipt
+
+        return cast(List[Receipt], receipts)
+
+    async def _extract_images_async(self, images: List[bytes]) -> List[Receipt]:
+        """Annotate non-document images in concurrent BATCH_SIZE chunks."""
+        if not images:
+            return []
+
+        # The async channel binds to the running event loop, so it is
+        # created per call rather than in __init__
+        channel = ImageAnnotatorGrpcAsyncIOTransport.create_channel(
+            _VISION_HOST, options=_CHANNEL_OPTIONS
+        )
+        async_client = vision.ImageAnnotatorAsyncClient(
+            transport=ImageAnnotatorGrpcAsyncIOTransport(channel=channel)
+        )
+
+        chunks = [
+            images[i:i + self.BATCH_SIZE]
+            for i in range(0, len(images), self.BATCH_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CHUNKS)
+
+        async def extract_chunk(chunk: List[bytes]) -> List[Receipt]:
+            async with semaphore:
+                return await self._extract_chunk(async_client, chunk)
+
+        try:
+            chunk_receipts = await asyncio.gather(*(extract_chunk(chunk) for chunk in chunks))
+        finally:
+            await channel.close()
+
+        return [receipt for receipts in chunk_receipts for receipt in receipts]
+
+    async def _extract_chunk(self, async_client, chunk: List[bytes]) -> List[Receipt]:
+        """
+        Run document_text_detection on up to BATCH_SIZE images in one RPC.
+
+        Responses are parsed as soon as this chunk's RPC completes, so
+        parsing overlaps with the other chunks still in flight.
+        Preprocessing runs on the default executor so Pillow's decode and
+        resize neither block the event loop nor serialize across chunks.
+        """
+        loop = asyncio.get_running_loop()
+        contents = await asyncio.gather(*(
+            loop.run_in_executor(None, self.preprocess_image, image_bytes)
+            for image_bytes in chunk
+        ))
+        requests = [
+            vision.AnnotateImageRequest(
+                image=types.Image(content=content),
+                features=[vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)],
+            )
+            for content in contents
+        ]
+        batch_response = await async_client.batch_annotate_images(requests=requests)
+        return [self._parse_response(response) for response in batch_response.responses]
+
+    @staticmethod
+    def _document_mime_type(image_bytes: bytes) -> Optional[str]:
+        """Return the MIME type if the input is a PDF/TIFF document."""
+        for signature, mime_type in _DOCUMENT_SIGNATURES:
+            if image_bytes.startswith(signature):
+                return mime_type
+        return None
+
+    def _extract_document(self, document_bytes: bytes, mime_type: str) -> Receipt:
+        """
+        Extract receipt data from a (possibly multi-page) PDF/TIFF.
+
+        The document is staged in the scratch GCS bucket and processed by
+        an async_batch_annotate_files job; the pages are merged into a
+        single Receipt. Staged input and output files are deleted after.
+
+        If the job exceeds DOCUMENT_TIMEOUT it is cancelled before cleanup.
+        Cancellation is best-effort, so a job already finishing may still
+        write output under fiscflow-ocr/ afterwards; a bucket lifecycle
+        rule on that prefix removes such leftovers.
+
+        Args:
+            document_bytes: Raw PDF/TIFF bytes
+            mime_type: 'application/pdf' or 'image/tiff'
+
+        Returns:
+            Receipt object with extracted data
+        """
+        if not self.scratch_bucket:
+            raise ValueError("PDF/TIFF input requires the 'scratch_bucket' option")
+
+        try:
+            from google.cloud import storage  # type: ignore[attr-defined]
+        except ImportError:
+            raise ImportError(
+                "PDF/TIFF input requires google-cloud-storage. "
+                "Install with: pip install fiscflow-receipt-ocr[gcs]"
+            )
+
+        bucket = storage.Client().bucket(self.scratch_bucket)
+        prefix = f"fiscflow-ocr/{uuid.uuid4().hex}/"
+        bucket.blob(prefix + 'input').upload_from_string(document_bytes, content_type=mime_type)
+
+        try:
+            request = vision.AsyncAnnotateFileRequest(
+                input_config=vision.InputConfig(
+                    gcs_source=vision.GcsSource(uri=f"gs://{self.scratch_bucket}/{prefix}input"),
+                    mime_type=mime_type,
+                ),
+                features=[vision.Feature(type_=vision.Feature.Type.DOCUMENT_TEXT_DETECTION)],
+                output_config=vision.OutputConfig(
+                    gcs_destination=vision.GcsDestination(
+                        uri=f"gs://{self.scratch_bucket}/{prefix}output/"
+                    ),
+                    batch_size=self.DOCUMENT_PAGES_PER_OUTPUT,
+                ),
+            )
+            operation = self.client.async_batch_annotate_files(requests=[request])
+            try:
+                operation.result(timeout=self.DOCUMENT_TIMEOUT)
+            except FutureTimeoutError:
+                # Stop the job so it does not write output after the cleanup below
+                operation.cancel()
+                raise
+
+            output_blobs = list(bucket.list_blobs(prefix=prefix + 'output/'))
+            workers = max(1, min(self.MAX_DOWNLOAD_WORKERS, len(output_blobs)))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                file_responses = list(pool.map(
+                    lambda blob: vision.AnnotateFileResponse.from_json(
+                        blob.download_as_bytes(), ignore_unknown_fields=True
+                    ),
+                    output_blobs,
+                ))
+        finally:
+            bucket.delete_blobs(list(bucket.list_blobs(prefix=prefix)))
+
+        page_responses = sorted(
+            (response for file_response in file_responses for response in file_response.responses),
+            key=lambda response: response.context.page_number,
+        )
+        page_scale = self.PDF_PIXELS_PER_INCH / 72 if mime_type == 'application/pdf' else 1.0
+        return self._parse_response(self._merge_page_responses(page_responses, page_scale))
+
+    @staticmethod
+    def _merge_page_responses(
+        page_responses: List,
+        page_scale: float = 1.0
+    ) -> vision.AnnotateImageResponse:
+        """
+        Combine per-page responses into one response covering the document.
+
+        File annotation output gives word boxes only as normalized
+        vertices, so each page's width and height are multiplied by
+        page_scale to express them in pixels.
+        """
+        for response in page_responses:
+            if response.error.message:
+                return response
+
+        pages = [page for r in page_responses for page in r.full_text_annotation.pages]
+        for page in pages:
+            page.width = round(page.width * page_scale)
+            page.height = round(page.height * page_scale)
+
+        return vision.AnnotateImageResponse(
+            full_text_annotation=vision.TextAnnotation(
+                text=''.join(r.full_text_annotation.text for r in page_responses),
+                pages=pages,
+            )
+        )
+
+    def _parse_response(self, response) -> Receipt:
+        """Build a Receipt from a single Vision API annotate response."""
         if response.error.message:
             raise Exception(f"Vision API error: {response.error.message}")
 
@@ -60,8 +403,7 @@ class GoogleVisionExtractor(BaseExtractor):
         # Extract structured data
         receipt.merchant_name = self._extract_merchant(full_text)
         receipt.receipt_date = self._extract_date(full_text)
-        receipt.receipt_total = self._extract_total(full_text)
-        receipt.tax_amount = self._extract_tax(full_text)
+        receipt.receipt_total, receipt.tax_amount = self._extract_total_and_tax(full_text)
 
         # Extract items using structured annotations
         items = self._extract_items_from_annotations(response, receipt.receipt_total)
@@ -72,83 +414,84 @@ class GoogleVisionExtractor(BaseExtractor):
 
     def _extract_merchant(self, text: str) -> Optional[str]:
         """Extract merchant name from top lines."""
-        lines = [l.strip() for l in text.split('\n') if l.strip()]
-        if not lines:
-            return None
+        lines = (line.strip() for line in text.split('\n'))
 
         # First non-empty line is usually merchant
-        ignore_patterns = [
-            r'receipt', r'invoice', r'bill', r'^\d+$', r'^tel:', r'^www\.'
-        ]
-
-        for line in lines[:5]:
-            should_ignore = any(re.search(p, line.lower()) for p in ignore_patterns)
+        for line in islice((line for line in lines if line), 5):
+            should_ignore = _MERCHANT_IGNORE_RE.search(line) is not None
             if not should_ignore and len(line) > 3:
-                return re.sub(r'[^a-zA-Z0-9\s\-&\.]', '', line).strip()
+                return _MERCHANT_CLEAN_RE.sub('', line).strip()
 
         return None
 
     def _extract_date(self, text: str) -> Optional[datetime]:
-        """Extract date from receipt text."""
-        date_patterns = [
-            r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})',
-            r'(\d{4}[-/]\d{1,2}[-/]\d{1,2})',
-        ]
-
-        for pattern in date_patterns:
-            match = re.search(pattern, text)
-            if match:
-                date_str = match.group(1)
-                date_formats = [
-                    '%m/%d/%Y', '%m-%d-%Y', '%Y/%m/%d', '%Y-%m-%d',
-                    '%m/%d/%y', '%m-%d-%y',
-                ]
-
-                for fmt in date_formats:
-                    try:
-                        return datetime.strptime(date_str, fmt)
-                    except ValueError:
-                        continue
+        """
+        Extract date from receipt text.
 
-        return None
+        A match is parsed only if it uses one separator, has a 2- or
+        4-digit year and a month of 1-12. dateutil would otherwise read
+        OCR slips such as '12/25/202' or fragments such as '23-12-25'
+        (within '2023-12-25') as other dates. 2-digit years follow
+        strptime's %y: 69-99 are 19xx, 00-68 are 20xx.
+        """
+        for pattern, month_group, year_group in _DATE_RES:
+            match = pattern.search(text)
+            if not (
+                match
+                and match.group(2) == match.group(4)
+                and len(match.group(year_group)) in (2, 4)
+                and 1 <= int(match.group(month_group)) <= 12
+            ):
+                continue
 
-    def _extract_total(self, text: str) -> Optional[float]:
-        """Extract total amount from receipt."""
-        lines = text.split('\n')
-        total_patterns = [
-            r'total[:\s]+\$?\s*(\d+\.\d{2})',
-            r'amount[:\s]+\$?\s*(\d+\.\d{2})',
-        ]
+            try:
+                parsed = date_parser.parse(
+                    match.group(0), dayfirst=False, yearfirst=month_group != 1
+                )
+            except (ValueError, OverflowError):
+                continue
 
-        for line in reversed(lines):
-            for pattern in total_patterns:
-                match = re.search(pattern, line.lower())
-                if match:
-                    try:
-                        return float(match.group(1))
-                    except ValueError:
-                        continue
+            # dateutil places 2-digit years in a window around today
+            year = match.group(year_group)
+            if len(year) == 2:
+                parsed = parsed.replace(year=int(year) + (1900 if int(year) >= 69 else 2000))
+            return parsed
 
         return None
 
-    def _extract_tax(self, text: str) -> Optional[float]:
-        """Extract tax amount from receipt."""
-        lines = text.split('\n')
-        tax_patterns = [
-            r'tax[:\s]+\$?\s*(\d+\.\d{2})',
-            r'vat[:\s]+\$?\s*(\d+\.\d{2})',
-        ]
-
-        for line in reversed(lines):
-            for pattern in tax_patterns:
-                match = re.search(pattern, line.lower())
-                if match:
-                    try:
-                        return float(match.group(1))
-                    except ValueError:
-                        continue
+    def _extract_total_and_tax(self, text: str) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Extract total and tax amounts from receipt in a single pass.
 
-        return None
+        Lines are scanned bottom-up; the last total/amount line and the
+        last tax/vat line on the receipt win. Within a line, a 'total'
+        amount is preferred over 'amount' and 'tax' over 'vat'; among
+        equal keywords the leftmost wins.
+        """
+        total: Optional[float] = None
+        tax: Optional[float] = None
+
+        for line in reversed(text.lower().split('\n')):
+            line_total: Optional[Tuple[int, float]] = None
+            line_tax: Optional[Tuple[int, float]] = None
+            for match in _MONEY_RE.finditer(line):
+                keyword = match.group(1)
+                candidate = (_MONEY_PRIORITY[keyword], float(match.group(2)))
+                if keyword in ('total', 'amount'):
+                    if line_total is None or candidate[0] < line_total[0]:
+                        line_total = candidate
+                elif line_tax is None or candidate[0] < line_tax[0]:
+                    line_tax = candidate
+
+            if total is None and line_total is not None:
+                total = line_total[1]
+            if tax is None and line_tax is not None:
+                tax = line_tax[1]
+
+            if total is not None and tax is not None:
+                break
+
+        return total, tax
 
     def _extract_items_from_annotations(
         self,
@@ -164,45 +507,46 @@ class GoogleVisionExtractor(BaseExtractor):
         if not vision_response or not vision_response.full_text_annotation:
             return []
 
-        items = []
-        pages = vision_response.full_text_annotation.pages
+        items: List[Dict] = []
+        # Walk the raw protobuf; proto-plus wrappers re-marshal on every
+        # attribute access, which dominates traversal time
+        pages = vision.TextAnnotation.pb(vision_response.full_text_annotation).pages
         if not pages:
             return []
 
         # Group words by line using Y coordinates
-        lines_data = self._group_words_by_line(pages)
+        texts, _, _, _, line_slices = self._group_words_by_line(pages)
+
+        # Per-line features, computed once and shared by the lookback scan
+        line_texts: List[str] = [' '.join(texts[start:end]) for start, end in line_slices]
+        # Word texts never contain newlines, so the lowercased join splits
+        # back into exactly one entry per line
+        lines_lower = '\n'.join(line_texts).lower().split('\n')
+        skip_mask: List[bool] = [_SKIP_RE.search(t) is not None for t in lines_lower]
+        digit_only_mask: List[bool] = [t.replace(' ', '').isdigit() for t in line_texts]
+        alpha_mask: List[bool] = [any(map(str.isalpha, t)) for t in line_texts]
+        upper_texts: List[str] = [t.upper() for t in line_texts]
 
         # Extract items with deduplication
-        skip_keywords = [
-            'subtotal', 'total', 'tax', 'change', 'cash', 'credit', 'debit',
-            'visa', 'mastercard', 'thank you', 'receipt', 'date', 'time',
-            'approved', 'customer', 'member', 'number', 'reference', 'invoice',
-        ]
-
-        used_item_names = set()
-        used_line_indices = set()
-
-        for idx, line_words in enumerate(lines_data):
-            if not line_words:
-                continue
-
-            line_text = ' '.join([w['text'] for w in line_words])
-            line_lower = line_text.lower()
+        used_item_names: Set[str] = set()
+        used_line_indices: Set[int] = set()
 
+        for idx, (start, end) in enumerate(line_slices):
             # Skip non-item lines
-            if any(keyword in line_lower for keyword in skip_keywords):
+            if skip_mask[idx]:
                 continue
 
+            line_words: List[str] = texts[start:end]
+
             # Look for price pattern
-            price_word = None
-            item_words = []
+            price_word: Optional[float] = None
+            item_words: List[str] = []
 
-            for i, word_data in enumerate(line_words):
-                word = word_data['text']
-                price_match = re.match(r'^\$?(\d+\.\d{2})$', word)
+            for i, word in enumerate(line_words):
+                price_match = _PRICE_RE.match(word)
                 if price_match:
                     price_word = float(price_match.group(1))
-                    item_words = [w['text'] for w in line_words[:i]]
+                    item_words = line_words[:i]
                     break
 
             # Multi-line: If price found but no item words, look back
@@ -213,39 +557,34 @@ class GoogleVisionExtractor(BaseExtractor):
 
                 # Look back for item name
                 for lookback in range(1, min(11, idx + 1)):
-                    prev_idx = idx - lookback
+                    prev_idx: int = idx - lookback
 
                     if prev_idx in used_line_indices:
                         continue
 
-                    prev_line_words = lines_data[prev_idx]
-                    prev_line_text = ' '.join([w['text'] for w in prev_line_words])
-                    prev_line_lower = prev_line_text.lower()
-
-                    if any(keyword in prev_line_lower for keyword in skip_keywords):
+                    if (
+                        skip_mask[prev_idx]
+                        or digit_only_mask[prev_idx]
+                        or len(line_texts[prev_idx]) < 3
+                        or upper_texts[prev_idx] in used_item_names
+                    ):
                         continue
 
-                    if prev_line_text.replace(' ', '').isdigit():
-                        continue
-
-                    if len(prev_line_text) < 3:
-                        continue
-
-                    if prev_line_text.upper() in used_item_names:
-                        continue
-
-                    if any(c.isalpha() for c in prev_line_text):
-                        item_words = [w['text'] for w in prev_line_words]
+                    if alpha_mask[prev_idx]:
+                        prev_start, prev_end = line_slices[prev_idx]
+                        item_words = texts[prev_start:prev_end]
                         used_line_indices.add(prev_idx)
                         break
 
             # Create item if we have both price and name
             if price_word and item_words:
-                item_name = ' '.join(item_words).strip()
+                item_name: str = ' '.join(item_words).strip()
 
                 if len(item_name) > 2 and not item_name.isdigit():
                     # Check for quantity pattern
-                    qty_match = re.match(r'^(\d+\.?\d*)\s*x?\s*(.+)$', item_name, re.IGNORECASE)
+                    quantity: float
+                    unit_price: float
+                    qty_match = _QTY_RE.match(item_name)
                     if qty_match:
                         quantity = float(qty_match.group(1))
                         item_name = qty_match.group(2).strip()
@@ -266,48 +605,76 @@ class GoogleVisionExtractor(BaseExtractor):
 
         return items
 
-    def _group_words_by_line(self, pages) -> List[List[Dict]]:
-        """Group words by their vertical position (Y coordinate)."""
-        lines_data = []
+    def _group_words_by_line(
+        self,
+        pages
+    ) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray, List[Tuple[int, int]]]:
+        """
+        Group words by their vertical position (Y coordinate).
+
+        Word data is returned as parallel arrays ordered line by line,
+        left to right within a line, so each line is a contiguous range.
 
+        Returns:
+            Tuple of (texts, xs, ys, confidences, line_slices) where
+            line_slices holds a (start, end) index range per line
+        """
+        # Single pass over the proto, remembering each paragraph's [start, end) range
+        texts: List[str] = []
+        coords: List[List[Tuple[float, float]]] = []
+        points: List[Tuple[float, float]]
+        confidences: List[float] = []
+        para_ranges: List[Tuple[int, int]] = []
         for page in pages:
+            width, height = page.width, page.height
             for block in page.blocks:
                 for paragraph in block.paragraphs:
-                    words_in_para = []
-
+                    start = len(texts)
                     for word in paragraph.words:
-                        vertices = word.bounding_box.vertices
-                        if vertices:
-                            y_coords = [v.y for v in vertices]
-                            x_coords = [v.x for v in vertices]
-                            avg_y = sum(y_coords) / len(y_coords)
-                            avg_x = sum(x_coords) / len(x_coords)
-
-                            word_text = ''.join([symbol.text for symbol in word.symbols])
-
-                            words_in_para.append({
-                                'text': word_text,
-                                'y': avg_y,
-                                'x': avg_x,
-                                'confidence': word.confidence
-                            })
-
-                    if words_in_para:
-                        words_in_para.sort(key=lambda w: w['y'])
-
-                        current_line = []
-                        current_y = words_in_para[0]['y']
-
-                        for word_data in words_in_para:
-                            if abs(word_data['y'] - current_y) < 15:
-                                current_line.append(word_data)
-                            else:
-                                if current_line:
-                                    lines_data.append(sorted(current_line, key=lambda w: w['x']))
-                                current_line = [word_data]
-                                current_y = word_data['y']
-
-                        if current_line:
-                            lines_data.append(sorted(current_line, key=lambda w: w['x']))
-
-        return lines_data
+                        box = word.bounding_box
+                        if box.vertices:
+                            points = [(v.x, v.y) for v in box.vertices]
+                        elif box.normalized_vertices and width and height:
+                            # File annotation (PDF/TIFF) output has only 0-1 coordinates
+                            points = [
+                                (v.x * width, v.y * height) for v in box.normalized_vertices
+                            ]
+                        else:
+                            continue
+                        if len(points) != 4:
+                            # Store a box that is not a quadrilateral as its centroid
+                            # repeated, so it fits the (N, 4, 2) array with the same mean
+                            n = len(points)
+                            centroid = (sum(x for x, _ in points) / n, sum(y for _, y in points) / n)
+                            points = [centroid] * 4
+                        coords.append(points)
+                        texts.append(''.join([symbol.text for symbol in word.symbols]))
+                        confidences.append(word.confidence)
+                    if len(texts) > start:
+                        para_ranges.append((start, len(texts)))
+
+        if not texts:
+            empty = np.empty(0, np.float32)
+            return [], empty, empty, empty, []
+
+        # Word bounding boxes are quadrilaterals, giving an (N, 4, 2) array
+        pts = np.array(coords, dtype=np.float32)
+        xs = pts[:, :, 0].mean(axis=1).astype(np.float32)
+        ys = pts[:, :, 1].mean(axis=1).astype(np.float32)
+        confs = np.array(confidences, dtype=np.float32)
+
+        # Order words by paragraph then Y, cluster them into lines, then
+        # order by line then X. lexsort is stable, so ties keep prior order.
+        para_ids = np.repeat(
+            np.arange(len(para_ranges), dtype=np.int32),
+            [end - start for start, end in para_ranges],
+        )
+        y_order = np.lexsort((ys, para_ids))
+        line_ids = cluster_lines(ys[y_order], para_ids[y_order], _LINE_THRESHOLD)
+        order = y_order[np.lexsort((xs[y_order], line_ids))]
+
+        bounds = [0] + (np.flatnonzero(np.diff(line_ids)) + 1).tolist() + [len(order)]
+        line_slices: List[Tuple[int, int]] = list(zip(bounds[:-1], bounds[1:]))
+
+        texts = [texts[i] for i in order.tolist()]
+        return texts, xs[order], ys[order], confs[order], line_slices
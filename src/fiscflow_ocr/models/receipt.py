@@ -1,10 +1,14 @@
 """Receipt data models."""
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field
 from typing import List, Optional
 from datetime import datetime
 
+# Slotted instances drop the per-object __dict__ (Python 3.10+ only)
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ReceiptItem:
     """Single line item from a receipt."""
     name: str
@@ -15,10 +19,16 @@ class ReceiptItem:
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        return asdict(self)
+        return {
+            'name': self.name,
+            'quantity': self.quantity,
+            'unit_price': self.unit_price,
+            'total_price': self.total_price,
+            'confidence': self.confidence,
+        }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Receipt:
     """Complete receipt data structure."""
     merchant_name: Optional[str] = None
@@ -29,16 +39,24 @@ class Receipt:
     items: List[ReceiptItem] = field(default_factory=list)
     currency: str = 'USD'
     confidence: float = 1.0
-    raw_text: str = ''
+    raw_text: str = field(default='', repr=False)
     receipt_id: Optional[str] = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
-        data = asdict(self)
-        # Convert datetime to ISO string
-        if self.receipt_date:
-            data['receipt_date'] = self.receipt_date.isoformat()
-        return data
+        # Built by hand rather than with asdict(), which deep-copies every field
+        return {
+            'merchant_name': self.merchant_name,
+            'receipt_total': self.receipt_total,
+            'receipt_date': self.receipt_date.isoformat() if self.receipt_date else None,
+            'tax_amount': self.tax_amount,
+            'tip_amount': self.tip_amount,
+            'items': [item.to_dict() for item in self.items],
+            'currency': self.currency,
+            'confidence': self.confidence,
+            'raw_text': self.raw_text,
+            'receipt_id': self.receipt_id,
+        }
 
     def add_item(self, item: ReceiptItem):
         """Add item to receipt."""
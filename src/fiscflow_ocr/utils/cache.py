@@ -0,0 +1,66 @@
+"""On-disk cache of extraction results keyed by image content."""
+import json
+import os
+import tempfile
+from hashlib import blake2b
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+class ResultCache:
+    """
+    Content-addressed store of receipt extraction results.
+
+    Each result is saved as a JSON file named after the BLAKE2b digest
+    of the image bytes, so re-processing an identical image skips the
+    OCR provider entirely.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory to store cached results in (created if missing)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(image_bytes: bytes) -> str:
+        """Return the cache key for an image."""
+        return blake2b(image_bytes, digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached result.
+
+        Args:
+            key: Cache key from key()
+
+        Returns:
+            Cached result dictionary, or None on a miss
+        """
+        try:
+            with open(self.cache_dir / f"{key}.json", 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, result: Dict):
+        """
+        Store a result.
+
+        Args:
+            key: Cache key from key()
+            result: JSON-serializable extraction result
+        """
+        # Write to a temp file and rename so readers never see partial JSON
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
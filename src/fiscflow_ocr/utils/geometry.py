@@ -0,0 +1,46 @@
+"""Geometry helpers for grouping OCR words into text lines."""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, nogil=True)
+def cluster_lines(ys: np.ndarray, group_ids: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Assign a line id to each word from its sorted Y coordinate.
+
+    A word joins the current line while it is in the same group (e.g.
+    paragraph) and within threshold of the first word's Y on that line;
+    otherwise it starts a new line.
+
+    Args:
+        ys: Word Y centroids, sorted ascending within each group
+        group_ids: Group of each word, with each group contiguous
+        threshold: Maximum vertical distance from the line's first word
+
+    Returns:
+        int32 array of line ids, non-decreasing and starting at 0
+    """
+    n = ys.shape[0]
+    line_ids = np.empty(n, np.int32)
+    if n == 0:
+        return line_ids
+
+    line_id = 0
+    current_y = ys[0]
+    current_group = group_ids[0]
+    for i in range(n):
+        if group_ids[i] != current_group or abs(ys[i] - current_y) >= threshold:
+            line_id += 1
+            current_y = ys[i]
+            current_group = group_ids[i]
+        line_ids[i] = line_id
+
+    return line_ids
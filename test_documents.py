@@ -0,0 +1,135 @@
+"""Regression tests for PDF/TIFF extraction through the file annotation API."""
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from unittest import mock
+
+import google.auth
+import pytest
+from google.auth.credentials import AnonymousCredentials
+from google.cloud import storage, vision
+
+from fiscflow_ocr.extractors.vision_api import GoogleVisionExtractor
+
+# US Letter, as file annotation output reports PDF page sizes: in points
+PAGE_WIDTH_PT = 612
+PAGE_HEIGHT_PT = 792
+
+PAGES = [
+    [['ACME', 'MARKET'], ['MILK', '2.99'], ['BREAD', '3.49']],
+    [['EGGS', '4.25'], ['TAX', '0.86'], ['TOTAL', '11.59']],
+]
+
+
+class FakeBlob:
+    def __init__(self, store, name):
+        self.store = store
+        self.name = name
+
+    def upload_from_string(self, data, content_type=None):
+        self.store[self.name] = data
+
+    def download_as_bytes(self):
+        return self.store[self.name]
+
+
+class FakeBucket:
+    def __init__(self):
+        self.store = {}
+
+    def blob(self, name):
+        return FakeBlob(self.store, name)
+
+    def list_blobs(self, prefix):
+        return [FakeBlob(self.store, name) for name in sorted(self.store) if name.startswith(prefix)]
+
+    def delete_blobs(self, blobs):
+        for blob in blobs:
+            del self.store[blob.name]
+
+
+def page_response(lines, page_number):
+    """Build one page of file annotation output: normalized boxes only."""
+    words = []
+    for line_index, line in enumerate(lines):
+        top = 72 + 24 * line_index
+        for word_index, text in enumerate(line):
+            left = 72 + 120 * word_index
+            corners = [(left, top), (left + 60, top), (left + 60, top + 10), (left, top + 10)]
+            words.append({
+                'bounding_box': {'normalized_vertices': [
+                    {'x': x / PAGE_WIDTH_PT, 'y': y / PAGE_HEIGHT_PT} for x, y in corners
+                ]},
+                'symbols': [{'text': c} for c in text],
+                'confidence': 0.9,
+            })
+
+    text = ''.join(' '.join(line) + '\n' for line in lines)
+    return vision.AnnotateImageResponse(
+        full_text_annotation={'text': text, 'pages': [{
+            'width': PAGE_WIDTH_PT,
+            'height': PAGE_HEIGHT_PT,
+            'blocks': [{'paragraphs': [{'words': words}]}],
+        }]},
+        context={'page_number': page_number},
+    )
+
+
+@pytest.fixture
+def bucket():
+    return FakeBucket()
+
+
+@pytest.fixture
+def extractor(monkeypatch, bucket):
+    """Extractor whose Vision client and scratch bucket are in-memory fakes."""
+    monkeypatch.setattr(google.auth, 'default', lambda **kwargs: (AnonymousCredentials(), None))
+    monkeypatch.setattr(storage, 'Client', lambda: mock.Mock(bucket=lambda name: bucket))
+    extractor = GoogleVisionExtractor(scratch_bucket='scratch')
+
+    def async_batch_annotate_files(requests):
+        output_prefix = requests[0].output_config.gcs_destination.uri[len('gs://scratch/'):]
+        # Later pages land in an earlier-sorting file to check page ordering
+        for name, page_number in (('output-2-to-2.json', 2), ('output-1-to-1.json', 1)):
+            file_response = vision.AnnotateFileResponse(
+                responses=[page_response(PAGES[page_number - 1], page_number)]
+            )
+            bucket.store[output_prefix + name] = vision.AnnotateFileResponse.to_json(file_response)
+        return mock.Mock()
+
+    extractor.client = mock.Mock(async_batch_annotate_files=async_batch_annotate_files)
+    return extractor
+
+
+def test_pdf_with_priced_lines_produces_items(extractor, bucket):
+    receipt = extractor.extract(b'%PDF-1.4 receipt')
+
+    assert [(item.name, item.total_price) for item in receipt.items] == [
+        ('MILK', 2.99), ('BREAD', 3.49), ('EGGS', 4.25),
+    ]
+    assert receipt.merchant_name == 'ACME MARKET'
+    assert receipt.receipt_total == 11.59
+    assert receipt.tax_amount == 0.86
+    # Staged input and output are removed
+    assert bucket.store == {}
+
+
+def test_pdf_page_size_is_scaled_from_points(extractor):
+    page_scale = extractor.PDF_PIXELS_PER_INCH / 72
+    merged = extractor._merge_page_responses([page_response(PAGES[0], 1)], page_scale)
+
+    page = merged.full_text_annotation.pages[0]
+    assert (page.width, page.height) == (1700, 2200)
+
+
+def test_timed_out_job_is_cancelled_before_cleanup(extractor, bucket):
+    calls = []
+    operation = mock.Mock()
+    operation.result.side_effect = FutureTimeoutError()
+    operation.cancel.side_effect = lambda: calls.append(('cancel', dict(bucket.store)))
+    extractor.client = mock.Mock(async_batch_annotate_files=lambda requests: operation)
+
+    with pytest.raises(FutureTimeoutError):
+        extractor.extract(b'%PDF-1.4 receipt')
+
+    # Cancelled while the staged input still existed, then cleaned up
+    assert len(calls) == 1 and calls[0][1]
+    assert bucket.store == {}
@@ -0,0 +1,30 @@
+"""Regression tests for total/tax extraction keyword rules."""
+import google.auth
+import pytest
+from google.auth.credentials import AnonymousCredentials
+
+from fiscflow_ocr.extractors.vision_api import GoogleVisionExtractor
+
+
+@pytest.fixture
+def extractor(monkeypatch):
+    """Extractor with anonymous credentials; no Vision calls are made."""
+    monkeypatch.setattr(google.auth, 'default', lambda **kwargs: (AnonymousCredentials(), None))
+    return GoogleVisionExtractor()
+
+
+@pytest.mark.parametrize('text, expected', [
+    # Within a line, 'total' beats 'amount' and 'tax' beats 'vat'
+    ('amount 5.00 total 6.00', (6.0, None)),
+    ('total 6.00 amount 5.00', (6.0, None)),
+    ('vat 1.00 tax 2.00', (None, 2.0)),
+    ('tax 2.00 vat 1.00', (None, 2.0)),
+    # Among equal keywords the leftmost wins
+    ('total 6.00 total 7.00', (6.0, None)),
+    # Lines are scanned bottom-up, so the last line with a match wins
+    ('TOTAL 3.00\nAmount: $4.00 Tax 0.50 VAT 0.40', (4.0, 0.5)),
+    ('Subtotal 10.00\nTax 0.80\nTotal 10.80', (10.8, 0.8)),
+    ('no amounts here', (None, None)),
+])
+def test_total_and_tax_keyword_priority(extractor, text, expected):
+    assert extractor._extract_total_and_tax(text) == expected